@@ -16,30 +16,62 @@ First run:
 CLI:
 - --reset  deletes current.json (next launch reseeds from Default.json)
 
+Input:
+- Keys are emitted through a virtual keyboard created on /dev/uinput.
+- If that device can't be created, a private ydotoold is spawned instead (socket, then ydotool CLI).
+
 UI syncing:
-- Guard prevents programmatic UI updates (preset load) from triggering on_any_change() and
-  overwriting config with half-applied values.
+- Guard prevents programmatic UI updates (preset load) from triggering the widget change
+  handlers and overwriting config with half-applied values.
 """
 from __future__ import annotations
 
+import fcntl
+import hashlib
 import json
 import os
 import random
 import re
-import subprocess
+import shutil
+import socket
+import struct
 import sys
 import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-import gi
+if TYPE_CHECKING:
+    # Only for annotations; at runtime subprocess is imported where a process is spawned.
+    import subprocess
 
-gi.require_version("Gtk", "4.0")
-gi.require_version("Gdk", "4.0")
-from gi.repository import Gdk, GLib, Gtk  # noqa: E402
+# Optional faster JSON backend.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 APP_ID = "com.rafael.runkmax"
 
+# struct input_event (linux/input.h): timeval, u16 type, u16 code, s32 value.
+# ydotoold reads one of these per datagram and replays it on its uinput device.
+_INPUT_EVENT = struct.Struct("llHHi")
+EV_SYN = 0x00
+EV_KEY = 0x01
+SYN_REPORT = 0
+_SYN_EVENT = _INPUT_EVENT.pack(0, 0, EV_SYN, SYN_REPORT, 0)
+
+# linux/uinput.h
+UINPUT_PATH = "/dev/uinput"
+_UI_DEV_CREATE = 0x5501
+_UI_DEV_DESTROY = 0x5502
+_UI_DEV_SETUP = 0x405C5503  # _IOW('U', 3, struct uinput_setup)
+_UI_SET_EVBIT = 0x40045564  # _IOW('U', 100, int)
+_UI_SET_KEYBIT = 0x40045565  # _IOW('U', 101, int)
+_BUS_VIRTUAL = 0x06
+# struct uinput_setup: input_id (bustype, vendor, product, version), name[80], ff_effects_max
+_UINPUT_SETUP = struct.Struct("HHHH80sI")
+
 DEFAULT_CONFIG: dict = {
     "keys": {
         "W": {"code": 17, "enabled": True, "label": "W"},
@@ -62,7 +94,30 @@ DEFAULT_CONFIG: dict = {
 
 
 def _deepcopy_jsonish(obj):
-    return json.loads(json.dumps(obj))
+    # Assumes JSON-like values: dicts, lists and immutable scalars.
+    if isinstance(obj, dict):
+        return {k: _deepcopy_jsonish(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_deepcopy_jsonish(v) for v in obj]
+    return obj
+
+
+def _same_jsonish(a, b) -> bool:
+    # Unlike ==, 1 vs 1.0 or True vs 1 differ: they serialize differently.
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same_jsonish(v, b[k]) for k, v in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same_jsonish(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _clone_config(cfg: dict) -> dict:
+    # Normalized configs are two levels deep: scalars, and keys -> flat dicts.
+    out = dict(cfg)
+    out["keys"] = {k: dict(v) for k, v in cfg["keys"].items()}
+    return out
 
 
 def get_user_config_dir() -> Path:
@@ -79,79 +134,161 @@ def get_user_presets_dir() -> Path:
     return get_user_config_dir() / "presets"
 
 
-def load_json(path: Path, fallback: dict) -> dict:
+# Parsed + normalized JSON keyed by path; entries are only reused while the
+# file's (mtime_ns, size) still match, and save_json() drops them on write.
+_PRESET_CACHE: dict[str, tuple[int, int, dict, bool]] = {}
+_PRESET_CACHE_LOCK = threading.Lock()
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: dict, pretty: bool) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def load_json_ex(path: Path, fallback: dict) -> tuple[dict, bool]:
+    """Like load_json(), plus whether the file already held exactly the normalized config."""
+    key = str(path)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            d = json.load(f)
+        st = path.stat()
+        with _PRESET_CACHE_LOCK:
+            cached = _PRESET_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return _clone_config(cached[2]), cached[3]
+
+        with open(path, "rb") as f:
+            d = _json_loads(f.read())
         if isinstance(d, dict):
-            return normalize_config(d, fallback)
+            cfg = normalize_config(d, fallback)
+            clean = _same_jsonish(cfg, d)
+            with _PRESET_CACHE_LOCK:
+                _PRESET_CACHE[key] = (st.st_mtime_ns, st.st_size, _clone_config(cfg), clean)
+            return cfg, clean
     except FileNotFoundError:
         pass
     except Exception:
         pass
-    return _deepcopy_jsonish(fallback)
+    return _deepcopy_jsonish(fallback), False
+
+
+def load_json(path: Path, fallback: dict) -> dict:
+    return load_json_ex(path, fallback)[0]
+
+
+# Digest of the last payload written per path, with the file's (mtime_ns, size)
+# right after that write, so identical rewrites can be skipped safely.
+_LAST_SAVED: dict[str, tuple[bytes, int, int]] = {}
 
 
-def save_json(path: Path, data: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def save_json(path: Path, data: dict, pretty: bool = True) -> None:
+    # Compact for current.json; presets stay indented and sorted.
+    payload = _json_dumps(data, pretty)
+
+    key = str(path)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    last = _LAST_SAVED.get(key)
+    if last and last[0] == digest:
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+        # Unchanged content and nobody touched the file since: nothing to write.
+        if st and st.st_mtime_ns == last[1] and st.st_size == last[2]:
+            return
+
     tmp = path.with_suffix(".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    try:
+        f = open(tmp, "wb")
+    except FileNotFoundError:
+        # Only the first save into a fresh config dir needs to create it.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(tmp, "wb")
+    with f:
+        f.write(payload)
+        # Data must be on disk before the rename is, or a crash can leave an empty file.
+        f.flush()
+        os.fsync(f.fileno())
     tmp.replace(path)
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    st = path.stat()
+    _LAST_SAVED[key] = (digest, st.st_mtime_ns, st.st_size)
+    with _PRESET_CACHE_LOCK:
+        _PRESET_CACHE.pop(key, None)
 
 
-def normalize_config(cfg: dict, fallback: dict) -> dict:
-    merged = _deepcopy_jsonish(fallback)
-    for k, v in cfg.items():
-        merged[k] = v
+def _to_bool(x, default: bool) -> bool:
+    return bool(x) if isinstance(x, (bool, int)) else default
 
-    merged.setdefault("keys", _deepcopy_jsonish(fallback["keys"]))
 
-    for k in ("W", "A", "S", "D"):
-        if k not in merged["keys"] or not isinstance(merged["keys"][k], dict):
-            merged["keys"][k] = _deepcopy_jsonish(fallback["keys"][k])
-        merged["keys"][k].setdefault("code", fallback["keys"][k]["code"])
-        merged["keys"][k].setdefault("enabled", fallback["keys"][k]["enabled"])
-        merged["keys"][k].setdefault("label", fallback["keys"][k].get("label", k))
+def _to_float(x, default: float) -> float:
+    try:
+        return float(x)
+    except Exception:
+        return default
 
-    def b(x, default=False):
-        return bool(x) if isinstance(x, (bool, int)) else default
 
-    def f(x, default=0.0):
-        try:
-            return float(x)
-        except Exception:
-            return default
+def _to_int(x, default: int) -> int:
+    try:
+        return int(x)
+    except Exception:
+        return default
+
+
+def _to_str(x, default: str) -> str:
+    return str(x) if isinstance(x, (str, int, float, bool)) else default
 
-    def i(x, default=0):
-        try:
-            return int(x)
-        except Exception:
-            return default
-
-    def s(x, default=""):
-        return str(x) if isinstance(x, (str, int, float, bool)) else default
-
-    merged["enable_diagonals"] = b(merged.get("enable_diagonals", True), True)
-    merged["min_delay"] = f(merged.get("min_delay", 0.25), 0.25)
-    merged["max_delay"] = f(merged.get("max_delay", 0.90), 0.90)
-    merged["press_min"] = f(merged.get("press_min", 0.06), 0.06)
-    merged["press_max"] = f(merged.get("press_max", 0.20), 0.20)
-    merged["idle_enabled"] = b(merged.get("idle_enabled", True), True)
-    merged["idle_chance"] = i(merged.get("idle_chance", 10), 10)
-    merged["idle_min"] = f(merged.get("idle_min", 1.0), 1.0)
-    merged["idle_max"] = f(merged.get("idle_max", 3.5), 3.5)
-    merged["double_tap_enabled"] = b(merged.get("double_tap_enabled", True), True)
-    merged["double_tap_chance"] = i(merged.get("double_tap_chance", 8), 8)
 
+_COERCE = {bool: _to_bool, float: _to_float, int: _to_int, str: _to_str}
+
+# (field, type, default used when the stored value can't be coerced)
+_CONFIG_SCHEMA: tuple[tuple[str, type, object], ...] = (
+    ("enable_diagonals", bool, True),
+    ("min_delay", float, 0.25),
+    ("max_delay", float, 0.90),
+    ("press_min", float, 0.06),
+    ("press_max", float, 0.20),
+    ("idle_enabled", bool, True),
+    ("idle_chance", int, 10),
+    ("idle_min", float, 1.0),
+    ("idle_max", float, 3.5),
+    ("double_tap_enabled", bool, True),
+    ("double_tap_chance", int, 8),
+)
+_EXPECTED_SCALAR_TYPES: dict[str, type] = {name: typ for name, typ, _default in _CONFIG_SCHEMA}
+_EXPECTED_KEY_FIELDS: dict[str, type] = {"code": int, "enabled": bool, "label": str}
+
+
+def _is_normalized_shape(cfg: dict) -> bool:
+    # Exact type checks: bool is an int subclass and must not pass for a number.
+    for name, typ in _EXPECTED_SCALAR_TYPES.items():
+        if type(cfg.get(name)) is not typ:
+            return False
+    keys = cfg.get("keys")
+    if not isinstance(keys, dict) or not all(isinstance(v, dict) for v in keys.values()):
+        return False
     for k in ("W", "A", "S", "D"):
-        merged["keys"][k]["enabled"] = b(merged["keys"][k].get("enabled", True), True)
-        merged["keys"][k]["code"] = i(
-            merged["keys"][k].get("code", fallback["keys"][k]["code"]),
-            fallback["keys"][k]["code"],
-        )
-        merged["keys"][k]["label"] = s(merged["keys"][k].get("label", k), k)
+        entry = keys.get(k)
+        if not isinstance(entry, dict):
+            return False
+        for field, typ in _EXPECTED_KEY_FIELDS.items():
+            if type(entry.get(field)) is not typ:
+                return False
+    return True
 
+
+def _clamp_config(merged: dict) -> dict:
     if merged["max_delay"] < merged["min_delay"]:
         merged["max_delay"] = merged["min_delay"]
     if merged["press_max"] < merged["press_min"]:
@@ -164,6 +301,36 @@ def normalize_config(cfg: dict, fallback: dict) -> dict:
     return merged
 
 
+def normalize_config(cfg: dict, fallback: dict) -> dict:
+    # Well-formed configs only need clamping.
+    if _is_normalized_shape(cfg):
+        return _clamp_config(_clone_config(cfg))
+
+    # One shallow copy per level; cfg's own key dicts are left untouched.
+    merged = dict(fallback)
+    merged.update(cfg)
+
+    src_keys = merged.get("keys")
+    if not isinstance(src_keys, dict):
+        src_keys = fallback["keys"]
+    merged["keys"] = {k: dict(v) for k, v in src_keys.items() if isinstance(v, dict)}
+
+    for name, typ, default in _CONFIG_SCHEMA:
+        v = merged.get(name, default)
+        merged[name] = v if type(v) is typ else _COERCE[typ](v, default)
+
+    for k in ("W", "A", "S", "D"):
+        fb = fallback["keys"][k]
+        entry = merged["keys"].get(k)
+        if entry is None:
+            entry = merged["keys"][k] = dict(fb)
+        entry["enabled"] = _to_bool(entry.get("enabled", fb["enabled"]), True)
+        entry["code"] = _to_int(entry.get("code", fb["code"]), fb["code"])
+        entry["label"] = _to_str(entry.get("label", fb.get("label", k)), k)
+
+    return _clamp_config(merged)
+
+
 def _friendly_key_name(keyval: int) -> str:
     name = Gdk.keyval_name(keyval) or ""
     if not name:
@@ -173,12 +340,16 @@ def _friendly_key_name(keyval: int) -> str:
     return name.replace("_", " ").title()
 
 
+_WS_RE = re.compile(r"\s+")
+_NAME_RE = re.compile(r"[A-Za-z0-9 _\-\.\(\)]+")
+
+
 def _sanitize_preset_name(name: str) -> str:
     name = name.strip()
-    name = re.sub(r"\s+", " ", name)
+    name = _WS_RE.sub(" ", name)
     if not name:
         return ""
-    if not re.fullmatch(r"[A-Za-z0-9 _\-\.\(\)]+", name):
+    if not _NAME_RE.fullmatch(name):
         return ""
     return name
 
@@ -186,12 +357,14 @@ def _sanitize_preset_name(name: str) -> str:
 def ensure_default_presets_exist() -> None:
     presets_dir = get_user_presets_dir()
     presets_dir.mkdir(parents=True, exist_ok=True)
+    with os.scandir(presets_dir) as it:
+        existing = {e.name for e in it}
 
     default_path = presets_dir / "Default.json"
     gaming_path = presets_dir / "Gaming.json"
     subtle_path = presets_dir / "subtle.json"
 
-    if not default_path.exists():
+    if default_path.name not in existing:
         save_json(
             default_path,
             {
@@ -215,10 +388,10 @@ def ensure_default_presets_exist() -> None:
             },
         )
 
-    if not gaming_path.exists():
+    if gaming_path.name not in existing:
         save_json(gaming_path, normalize_config(_deepcopy_jsonish(DEFAULT_CONFIG), DEFAULT_CONFIG))
 
-    if not subtle_path.exists():
+    if subtle_path.name not in existing:
         save_json(
             subtle_path,
             {
@@ -261,148 +434,331 @@ def handle_cli_reset_if_requested(argv: list[str]) -> tuple[bool, list[str]]:
     return True, filtered
 
 
+class EngineParams(NamedTuple):
+    """Flat, immutable view of the config values the engine loop reads."""
+
+    vert: tuple[int, ...]
+    horiz: tuple[int, ...]
+    enable_diag: bool
+    min_delay: float
+    max_delay: float
+    press_min: float
+    press_max: float
+    idle_enabled: bool
+    idle_p: float
+    idle_min: float
+    idle_max: float
+    double_enabled: bool
+    double_p: float
+
+    @classmethod
+    def from_config(cls, config: dict) -> EngineParams:
+        keys_cfg = config["keys"]
+        vert = tuple(keys_cfg[k]["code"] for k in ("W", "S") if keys_cfg[k]["enabled"])
+        horiz = tuple(keys_cfg[k]["code"] for k in ("A", "D") if keys_cfg[k]["enabled"])
+        return cls(
+            vert=vert,
+            horiz=horiz,
+            enable_diag=bool(config.get("enable_diagonals", True)) and bool(vert) and bool(horiz),
+            min_delay=float(config["min_delay"]),
+            max_delay=float(config["max_delay"]),
+            press_min=float(config["press_min"]),
+            press_max=float(config["press_max"]),
+            idle_enabled=bool(config.get("idle_enabled", True)),
+            idle_p=1.0 / max(2, int(config.get("idle_chance", 10))),
+            idle_min=float(config.get("idle_min", 1.0)),
+            idle_max=float(config.get("idle_max", 3.5)),
+            double_enabled=bool(config.get("double_tap_enabled", True)),
+            double_p=1.0 / max(2, int(config.get("double_tap_chance", 8))),
+        )
+
+
+class UInputKeyboard:
+    """Virtual keyboard on /dev/uinput: what ydotoold does, without the daemon or IPC."""
+
+    def __init__(self, codes: tuple[int, ...]):
+        self._lock = threading.Lock()
+        # No O_CREAT: if the uinput module isn't loaded, fail instead of leaving a plain
+        # file at /dev/uinput that would shadow the device node once it appears.
+        self._dev = os.fdopen(os.open(UINPUT_PATH, os.O_WRONLY | os.O_NONBLOCK), "wb", buffering=0)
+        try:
+            fd = self._dev.fileno()
+            fcntl.ioctl(fd, _UI_SET_EVBIT, EV_KEY)
+            # Advertise the regular keyboard range too, so the device is classified as a keyboard.
+            for code in sorted(set(range(1, 256)).union(codes)):
+                fcntl.ioctl(fd, _UI_SET_KEYBIT, code)
+            fcntl.ioctl(fd, _UI_DEV_SETUP, _UINPUT_SETUP.pack(_BUS_VIRTUAL, 0x1, 0x1, 1, b"runk-max", 0))
+            fcntl.ioctl(fd, _UI_DEV_CREATE)
+        except OSError:
+            self._dev.close()
+            raise
+        # EV_KEY + EV_SYN frames for the configured codes, packed once and written whole.
+        self._frames = {
+            (code, value): _INPUT_EVENT.pack(0, 0, EV_KEY, code, value) + _SYN_EVENT
+            for code in codes
+            for value in (0, 1)
+        }
+
+    def emit(self, code: int, value: int) -> bool:
+        with self._lock:
+            if self._dev.closed:
+                return False
+            frame = self._frames.get((code, value))
+            if frame is None:
+                frame = _INPUT_EVENT.pack(0, 0, EV_KEY, code, value) + _SYN_EVENT
+            self._dev.write(frame)
+        return True
+
+    def close(self):
+        # Destroying the device makes the kernel release any key still held down.
+        with self._lock:
+            if self._dev.closed:
+                return
+            try:
+                fcntl.ioctl(self._dev.fileno(), _UI_DEV_DESTROY)
+            except OSError:
+                pass
+            self._dev.close()
+
+
 class EngineThread:
     def __init__(self):
         self._stop = threading.Event()
-        self._pause = threading.Event()
+        # The paused loop sleeps on this until toggle_pause()/stop() notify it.
+        self._cv = threading.Condition()
+        self._paused = False
         self.thread: threading.Thread | None = None
 
         self.ydotoold_proc: subprocess.Popen | None = None
         self.socket_path: str | None = None
         self.started_ydotoold: bool = False
         self._ydotool_lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._child_env: dict[str, str] | None = None
+        self._uinput: UInputKeyboard | None = None
 
     def start(self, config: dict, on_status):
         if self.thread and self.thread.is_alive():
             return
         self._stop.clear()
-        self._pause.clear()
-        self.thread = threading.Thread(target=self._run, args=(config, on_status), daemon=True)
+        self._paused = False
+        self.thread = threading.Thread(target=self._run_safely, args=(config, on_status), daemon=True)
         self.thread.start()
 
     def stop(self):
-        self._stop.set()
-        self._pause.clear()
+        with self._cv:
+            self._stop.set()
+            self._paused = False
+            self._cv.notify_all()
         if self.thread:
             self.thread.join(timeout=1.5)
         self.thread = None
-        self._stop_ydotoold()
+        self._close_output()
 
     def toggle_pause(self):
-        if self._pause.is_set():
-            self._pause.clear()
-        else:
-            self._pause.set()
+        with self._cv:
+            self._paused = not self._paused
+            self._cv.notify_all()
+
+    def _run_safely(self, config: dict, on_status):
+        # An engine error must still end the run with a "Stopped" status.
+        try:
+            self._run(config, on_status)
+        except Exception as exc:
+            self._close_output()
+            GLib.idle_add(on_status, f"Stopped: engine error ({exc})")
 
     def _run(self, config: dict, on_status):
+        last_status = None
+
         def status(s: str):
-            GLib.idle_add(on_status, s)
+            # Only post state changes; the window derives engine state from these.
+            nonlocal last_status
+            if s != last_status:
+                last_status = s
+                GLib.idle_add(on_status, s)
 
         enabled = {k: v for k, v in config["keys"].items() if v.get("enabled")}
         if len(enabled) < 2:
             status("Stopped: enable at least 2 keys")
             return
 
-        vert = [config["keys"][k]["code"] for k in ("W", "S") if config["keys"][k]["enabled"]]
-        horiz = [config["keys"][k]["code"] for k in ("A", "D") if config["keys"][k]["enabled"]]
-        enable_diag = bool(config.get("enable_diagonals", True)) and (len(vert) > 0 and len(horiz) > 0)
+        params = EngineParams.from_config(config)
+        vert, horiz = params.vert, params.horiz
 
-        if not self._ensure_ydotoold():
-            status("Stopped: ydotoold missing or failed")
+        if not self._open_output(vert + horiz):
+            if self._stop.is_set():
+                status("Stopped")
+                self._close_output()
+            else:
+                status("Stopped: no /dev/uinput access and ydotoold missing or failed")
             return
 
         status("Running")
 
-        min_delay = float(config["min_delay"])
-        max_delay = float(config["max_delay"])
-        press_min = float(config["press_min"])
-        press_max = float(config["press_max"])
+        min_delay, max_delay = params.min_delay, params.max_delay
+        press_min, press_max = params.press_min, params.press_max
+        idle_enabled, idle_p = params.idle_enabled, params.idle_p
+        idle_min, idle_max = params.idle_min, params.idle_max
+        double_enabled, double_p = params.double_enabled, params.double_p
 
-        idle_enabled = bool(config.get("idle_enabled", True))
-        idle_chance = int(config.get("idle_chance", 10))
-        idle_min = float(config.get("idle_min", 1.0))
-        idle_max = float(config.get("idle_max", 3.5))
+        rng = random.Random()
+        uniform = rng.uniform
+        choice = rng.choice
+        rand = rng.random
 
-        double_enabled = bool(config.get("double_tap_enabled", True))
-        double_chance = int(config.get("double_tap_chance", 8))
+        # Only set when our ydotoold is running.
+        env = self._child_env
+        ydotool_bin = shutil.which("ydotool") if env is not None else None
+        cli_fallback = ydotool_bin is not None
 
-        env = os.environ.copy()
-        if self.socket_path:
-            env["YDOTOOL_SOCKET"] = self.socket_path
+        sock_events = {(c, v): _INPUT_EVENT.pack(0, 0, EV_KEY, c, v) for c in vert + horiz for v in (0, 1)}
+
+        def send_key(code: int, value: int) -> bool:
+            uinput = self._uinput
+            if uinput is not None:
+                try:
+                    return uinput.emit(code, value)
+                except OSError:
+                    self._uinput = None
+                    uinput.close()
+            sock = self._sock
+            if sock is None:
+                return False
+            try:
+                sock.send(sock_events[code, value])
+                sock.send(_SYN_EVENT)
+                return True
+            except OSError:
+                self._sock = None
+                sock.close()
+                return False
+
+        # ydotool CLI arguments per keycode, formatted once for the fallback path.
+        cli_press_args = {c: (f"{c}:1", f"{c}:0") for c in vert + horiz}
+
+        def run_ydotool(*args: str):
+            import subprocess
 
-        def press_key(code: int):
-            subprocess.run(
-                ["ydotool", "key", f"{code}:1"],
-                env=env,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            time.sleep(random.uniform(press_min, press_max))
             subprocess.run(
-                ["ydotool", "key", f"{code}:0"],
+                [ydotool_bin, "key", *args],
                 env=env,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
 
-        def maybe_double(code: int):
-            press_key(code)
-            if double_enabled and random.randint(1, max(2, double_chance)) == 1:
-                time.sleep(random.uniform(0.03, 0.12))
-                press_key(code)
+        monotonic = time.monotonic
+        # Waits are on the stop event so stop() cuts them short.
+        wait = self._stop.wait
+        stopping = self._stop.is_set
+
+        def sleep_until(deadline: float):
+            remaining = deadline - monotonic()
+            if remaining > 0:
+                wait(remaining)
+
+        def press_key(
+            code: int,
+            lo: float = press_min,
+            hi: float = press_max,
+            uniform=uniform,
+            monotonic=monotonic,
+            send_key=send_key,
+            sleep_until=sleep_until,
+            cli_args=cli_press_args,
+            stopping=stopping,
+            cli_fallback=cli_fallback,
+        ) -> bool:
+            # False means no output path is left and the engine has to stop.
+            if stopping():
+                return True
+            hold = uniform(lo, hi)
+            release_at = monotonic() + hold
+            if send_key(code, 1):
+                sleep_until(release_at)
+                if send_key(code, 0):
+                    return True
+                if not cli_fallback:
+                    return False
+                run_ydotool(cli_args[code][1])
+                return True
+            if not cli_fallback:
+                return False
+            # CLI fallback: one invocation per press, ydotool itself waits `hold` between down and up.
+            run_ydotool(f"--key-delay={round(hold * 1000)}", *cli_args[code])
+            return True
+
+        def maybe_double(
+            code: int,
+            enabled: bool = double_enabled,
+            p: float = double_p,
+            press_key=press_key,
+            rand=rand,
+            uniform=uniform,
+            wait=wait,
+        ) -> bool:
+            if not press_key(code):
+                return False
+            if enabled and rand() < p:
+                wait(uniform(0.03, 0.12))
+                return press_key(code)
+            return True
 
-        paused_reported = False
+        # Two entries per axis keeps the axes equally likely.
+        def axis_pairs(codes: tuple[int, ...]) -> list[tuple[int, int]]:
+            if len(codes) == 2:
+                return [(codes[0], codes[1]), (codes[1], codes[0])]
+            return [(codes[0], codes[0])] * 2 if codes else []
+
+        axis_moves = axis_pairs(vert) + axis_pairs(horiz)
+        diag_moves = [(v, h) for v in vert for h in horiz]
+        # Axis vs diagonal stays 50/50.
+        if params.enable_diag:
+            moves = tuple(axis_moves * len(diag_moves) + diag_moves * len(axis_moves))
+        else:
+            moves = tuple(axis_moves)
+        sequences = tuple((a, b, b, a) for first, second in moves for a, b in ((first, second), (second, first)))
 
         while not self._stop.is_set():
-            while self._pause.is_set() and not self._stop.is_set():
-                if not paused_reported:
-                    status("Paused")
-                    paused_reported = True
-                time.sleep(0.15)
+            if self._paused:
+                status("Paused")
+                with self._cv:
+                    while self._paused and not self._stop.is_set():
+                        self._cv.wait()
+                if self._stop.is_set():
+                    break
+                status("Running")
+
+            if idle_enabled and rand() < idle_p:
+                if wait(uniform(idle_min, idle_max)):
+                    break
+
+            if not all(maybe_double(code) for code in choice(sequences)):
+                status("Stopped: key output failed")
+                self._close_output()
+                return
 
-            if self._stop.is_set():
+            if wait(uniform(min_delay, max_delay)):
                 break
 
-            paused_reported = False
-            status("Running")
-
-            if idle_enabled and random.randint(1, max(2, idle_chance)) == 1:
-                time.sleep(random.uniform(idle_min, idle_max))
-
-            move_type = random.choice(["axis", "diag"]) if enable_diag else "axis"
-
-            if move_type == "diag":
-                keys = [random.choice(vert), random.choice(horiz)]
-            else:
-                if vert and horiz:
-                    axis = random.choice(["vert", "horiz"])
-                elif vert:
-                    axis = "vert"
-                else:
-                    axis = "horiz"
-
-                if axis == "vert":
-                    first = random.choice(vert)
-                    opp = [c for c in vert if c != first]
-                    second = opp[0] if opp else first
-                    keys = [first, second]
-                else:
-                    first = random.choice(horiz)
-                    opp = [c for c in horiz if c != first]
-                    second = opp[0] if opp else first
-                    keys = [first, second]
-
-            if random.random() < 0.5:
-                keys = list(reversed(keys))
-
-            for code in keys:
-                maybe_double(code)
-            for code in reversed(keys):
-                maybe_double(code)
-
-            time.sleep(random.uniform(min_delay, max_delay))
-
         status("Stopped")
+        self._close_output()
+
+    def _open_output(self, codes: tuple[int, ...]) -> bool:
+        # /dev/uinput first; ydotoold (socket, then CLI) is the fallback.
+        self._child_env = None
+        try:
+            self._uinput = UInputKeyboard(codes)
+        except OSError:
+            self._uinput = None
+            return self._ensure_ydotoold()
+        # Give the compositor a moment to pick up the new device before the first key.
+        return not self._stop.wait(0.25)
+
+    def _close_output(self):
+        uinput, self._uinput = self._uinput, None
+        if uinput is not None:
+            uinput.close()
         self._stop_ydotoold()
 
     def _ensure_ydotoold(self) -> bool:
@@ -414,8 +770,7 @@ class EngineThread:
             else:
                 self.socket_path = str(Path.home() / f".ydotool_runk_socket_{pid}")
 
-            env = os.environ.copy()
-            env["YDOTOOL_SOCKET"] = self.socket_path
+            self._child_env = env = {**os.environ, "YDOTOOL_SOCKET": self.socket_path}
 
             try:
                 os.remove(self.socket_path)
@@ -424,26 +779,61 @@ class EngineThread:
             except Exception:
                 pass
 
+            ydotoold_bin = shutil.which("ydotoold")
+            if ydotoold_bin is None:
+                return False
+
+            import subprocess
+
             try:
                 uid = os.getuid()
                 gid = os.getgid()
                 self.ydotoold_proc = subprocess.Popen(
-                    ["ydotoold", f"--socket-path={self.socket_path}", f"--socket-own={uid}:{gid}"],
+                    [ydotoold_bin, f"--socket-path={self.socket_path}", f"--socket-own={uid}:{gid}"],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                     env=env,
                 )
                 self.started_ydotoold = True
-                time.sleep(0.25)
-                return True
             except FileNotFoundError:
                 return False
             except Exception:
                 return False
 
+            # Retry connect() with bounded backoff; give up if the daemon exited.
+            deadline = time.monotonic() + 1.0
+            delay = 0.002
+            while True:
+                self._sock = self._connect_ydotoold()
+                if self._sock is not None:
+                    break
+                if self.ydotoold_proc.poll() is not None or time.monotonic() >= deadline:
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+            return True
+
+    def _connect_ydotoold(self) -> socket.socket | None:
+        # None -> use the CLI.
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        # A stuck daemon makes send() time out and press_key fall back to the CLI.
+        sock.settimeout(0.5)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            return None
+        return sock
+
     def _stop_ydotoold(self):
         with self._ydotool_lock:
+            if self._sock is not None:
+                self._sock.close()
+                self._sock = None
+
             if self.ydotoold_proc and self.ydotoold_proc.poll() is None:
+                import subprocess
+
                 self.ydotoold_proc.terminate()
                 try:
                     self.ydotoold_proc.wait(timeout=1.0)
@@ -463,6 +853,43 @@ class EngineThread:
             self.started_ydotoold = False
 
 
+# --reset needs none of GTK; handle it before paying for GObject introspection.
+# (EngineThread and _friendly_key_name only touch GLib/Gdk at call time.)
+if __name__ == "__main__":
+    if handle_cli_reset_if_requested(sys.argv)[0]:
+        raise SystemExit(0)
+
+import gi  # noqa: E402
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Gdk", "4.0")
+from gi.repository import Gdk, GLib, Gtk  # noqa: E402
+
+
+# Rows of the Behavior grid, top to bottom: (config key, label) for a check button
+# spanning both columns, plus (min, max, step) for a labelled spin button.
+BEHAVIOR_ROWS: tuple[tuple, ...] = (
+    ("enable_diagonals", "Enable diagonals (needs vertical + horizontal enabled)"),
+    ("min_delay", "Min delay (s):", 0.01, 10.0, 0.01),
+    ("max_delay", "Max delay (s):", 0.01, 10.0, 0.01),
+    ("press_min", "Press min (s):", 0.01, 2.0, 0.01),
+    ("press_max", "Press max (s):", 0.01, 2.0, 0.01),
+    ("idle_enabled", "Enable idle gaps"),
+    ("idle_chance", "Idle chance (1 in N):", 2, 200, 1),
+    ("idle_min", "Idle min (s):", 0.1, 60.0, 0.1),
+    ("idle_max", "Idle max (s):", 0.1, 60.0, 0.1),
+    ("double_tap_enabled", "Enable double taps"),
+    ("double_tap_chance", "Double tap chance (1 in N):", 2, 200, 1),
+)
+
+# (min key, max key) pairs where the max is raised to follow the min.
+_RANGE_PAIRS: tuple[tuple[str, str], ...] = (
+    ("min_delay", "max_delay"),
+    ("press_min", "press_max"),
+    ("idle_min", "idle_max"),
+)
+
+
 class PresetSaveWindow(Gtk.Window):
     def __init__(self, parent: Gtk.Window, on_save):
         super().__init__(title="Save Preset", transient_for=parent, modal=True)
@@ -551,6 +978,11 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
         self._syncing_ui = False
         self.capture_target: str | None = None
         self._capturing_btn: Gtk.Button | None = None
+        self._save_pending_id: int | None = None
+        # Last engine state posted; button sensitivity follows it.
+        self._engine_running = False
+        # Names currently shown in the preset dropdown, in model order.
+        self._preset_names: list[str] = []
 
         ensure_default_presets_exist()
 
@@ -563,10 +995,13 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
                 if default_preset.exists()
                 else _deepcopy_jsonish(DEFAULT_CONFIG)
             )
+            up_to_date = False
         else:
-            self.config = load_json(self.config_path, DEFAULT_CONFIG)
+            self.config, up_to_date = load_json_ex(self.config_path, DEFAULT_CONFIG)
 
-        save_json(self.config_path, self.config)
+        # Only rewrite current.json when it was missing, unreadable or needed normalizing.
+        if not up_to_date:
+            save_json(self.config_path, self.config, pretty=False)
 
         self.engine = EngineThread()
 
@@ -631,10 +1066,10 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
         row = 0
         for name in ("W", "A", "S", "D"):
             chk = Gtk.CheckButton(label=f"{name} enabled")
-            chk.connect("toggled", self.on_any_change)
+            chk.connect("toggled", self.on_key_field_changed, name, "enabled")
 
             code = Gtk.SpinButton.new_with_range(1, 400, 1)
-            code.connect("value-changed", self.on_any_change)
+            code.connect("value-changed", self.on_key_field_changed, name, "code")
 
             label = Gtk.Label(label=f"Key: {self.config['keys'][name].get('label', name)}")
             label.set_xalign(0.0)
@@ -660,82 +1095,34 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
         grid.set_margin_end(8)
         frame_opts.set_child(grid)
 
-        r = 0
-        self.diag_check = Gtk.CheckButton(label="Enable diagonals (needs vertical + horizontal enabled)")
-        self.diag_check.connect("toggled", self.on_any_change)
-        grid.attach(self.diag_check, 0, r, 2, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Min delay (s):", xalign=0.0), 0, r, 1, 1)
-        self.min_delay = Gtk.SpinButton.new_with_range(0.01, 10.0, 0.01)
-        self.min_delay.connect("value-changed", self.on_any_change)
-        grid.attach(self.min_delay, 1, r, 1, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Max delay (s):", xalign=0.0), 0, r, 1, 1)
-        self.max_delay = Gtk.SpinButton.new_with_range(0.01, 10.0, 0.01)
-        self.max_delay.connect("value-changed", self.on_any_change)
-        grid.attach(self.max_delay, 1, r, 1, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Press min (s):", xalign=0.0), 0, r, 1, 1)
-        self.press_min = Gtk.SpinButton.new_with_range(0.01, 2.0, 0.01)
-        self.press_min.connect("value-changed", self.on_any_change)
-        grid.attach(self.press_min, 1, r, 1, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Press max (s):", xalign=0.0), 0, r, 1, 1)
-        self.press_max = Gtk.SpinButton.new_with_range(0.01, 2.0, 0.01)
-        self.press_max.connect("value-changed", self.on_any_change)
-        grid.attach(self.press_max, 1, r, 1, 1)
-        r += 1
-
-        self.idle_check = Gtk.CheckButton(label="Enable idle gaps")
-        self.idle_check.connect("toggled", self.on_any_change)
-        grid.attach(self.idle_check, 0, r, 2, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Idle chance (1 in N):", xalign=0.0), 0, r, 1, 1)
-        self.idle_chance = Gtk.SpinButton.new_with_range(2, 200, 1)
-        self.idle_chance.connect("value-changed", self.on_any_change)
-        grid.attach(self.idle_chance, 1, r, 1, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Idle min (s):", xalign=0.0), 0, r, 1, 1)
-        self.idle_min = Gtk.SpinButton.new_with_range(0.1, 60.0, 0.1)
-        self.idle_min.connect("value-changed", self.on_any_change)
-        grid.attach(self.idle_min, 1, r, 1, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Idle max (s):", xalign=0.0), 0, r, 1, 1)
-        self.idle_max = Gtk.SpinButton.new_with_range(0.1, 60.0, 0.1)
-        self.idle_max.connect("value-changed", self.on_any_change)
-        grid.attach(self.idle_max, 1, r, 1, 1)
-        r += 1
-
-        self.double_check = Gtk.CheckButton(label="Enable double taps")
-        self.double_check.connect("toggled", self.on_any_change)
-        grid.attach(self.double_check, 0, r, 2, 1)
-        r += 1
-
-        grid.attach(Gtk.Label(label="Double tap chance (1 in N):", xalign=0.0), 0, r, 1, 1)
-        self.double_chance = Gtk.SpinButton.new_with_range(2, 200, 1)
-        self.double_chance.connect("value-changed", self.on_any_change)
-        grid.attach(self.double_chance, 1, r, 1, 1)
+        self._field_widgets: dict[str, Gtk.Widget] = {}
+        for r, (key, text, *spin_range) in enumerate(BEHAVIOR_ROWS):
+            if spin_range:
+                grid.attach(Gtk.Label(label=text, xalign=0.0), 0, r, 1, 1)
+                widget = Gtk.SpinButton.new_with_range(*spin_range)
+                widget.connect("value-changed", self.on_field_changed, key)
+                grid.attach(widget, 1, r, 1, 1)
+            else:
+                widget = Gtk.CheckButton(label=text)
+                widget.connect("toggled", self.on_field_changed, key)
+                grid.attach(widget, 0, r, 2, 1)
+            self._field_widgets[key] = widget
 
         self.push_config_to_ui()
         self.connect("close-request", self.on_close)
 
     # ---- presets ----
     def list_presets(self) -> list[str]:
-        presets_dir = get_user_presets_dir()
-        if not presets_dir.exists():
+        try:
+            with os.scandir(get_user_presets_dir()) as it:
+                names = sorted(e.name for e in it if e.name.endswith(".json") and e.is_file())
+        except FileNotFoundError:
             return ["(none)"]
-        names = sorted([p.name for p in presets_dir.glob("*.json")])
         return names if names else ["(none)"]
 
     def refresh_presets_dropdown(self, select_name: str | None):
         names = self.list_presets()
+        self._preset_names = names
         model = Gtk.StringList.new(names)
         self.preset_combo.set_model(model)
         if select_name and select_name in names:
@@ -751,7 +1138,8 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
             self.set_status("Finish capture before loading preset")
             return
 
-        names = self.list_presets()
+        # Index into what the dropdown shows, not a fresh listing that may have shifted.
+        names = self._preset_names
         if names == ["(none)"]:
             self.set_status("No presets found")
             return
@@ -761,11 +1149,9 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
             return
 
         preset_path = get_user_presets_dir() / names[idx]
-        preset_cfg = load_json(preset_path, DEFAULT_CONFIG)
-
-        self.config = normalize_config(preset_cfg, DEFAULT_CONFIG)
+        self.config = load_json(preset_path, DEFAULT_CONFIG)
         self.push_config_to_ui()
-        save_json(self.config_path, self.config)
+        save_json(self.config_path, self.config, pretty=False)
         self.set_status(f"Loaded preset: {preset_path.name}")
 
     def on_save_preset_clicked(self, *_):
@@ -808,40 +1194,90 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
 
         PresetSaveWindow(self, do_save).present()
 
+    # ---- persistence ----
+    def _schedule_save(self):
+        # Coalesce bursts of widget changes (spin drags) into one write after 250 ms of quiet.
+        if self._save_pending_id is not None:
+            GLib.source_remove(self._save_pending_id)
+        self._save_pending_id = GLib.timeout_add(250, self._on_save_timeout)
+
+    def _on_save_timeout(self):
+        self._save_pending_id = None
+        save_json(self.config_path, self.config, pretty=False)
+        return GLib.SOURCE_REMOVE
+
+    def _flush_save(self):
+        if self._save_pending_id is not None:
+            GLib.source_remove(self._save_pending_id)
+            self._save_pending_id = None
+        save_json(self.config_path, self.config, pretty=False)
+
     # ---- lifecycle ----
     def on_close(self, *_):
+        if self._save_pending_id is not None:
+            self._flush_save()
         self.engine.stop()
         return False
 
     def set_status(self, text: str):
         self.status_label.set_label(f"Status: {text}")
-        running = (text == "Running" or text == "Paused")
+        running = self._engine_running
         self.start_btn.set_sensitive((not running) and (not self.capture_target))
         self.pause_btn.set_sensitive(running)
         self.stop_btn.set_sensitive(running)
         return False
 
+    def on_engine_status(self, text: str):
+        # The engine only posts transitions: "Running", "Paused", or "Stopped[: reason]".
+        self._engine_running = text in ("Running", "Paused")
+        return self.set_status(text)
+
     # ---- controls ----
     def on_start(self, *_):
         if self.capture_target:
             self.set_status("Finish capture first")
             return
         self.pull_ui_to_config()
-        save_json(self.config_path, self.config)
-        self.engine.start(self.config, self.set_status)
+        self._flush_save()
+        self.engine.start(self.config, self.on_engine_status)
 
     def on_pause(self, *_):
         self.engine.toggle_pause()
 
     def on_stop(self, *_):
         self.engine.stop()
-        self.set_status("Stopped")
+        self.on_engine_status("Stopped")
 
-    def on_any_change(self, *_):
+    # Each widget updates only its own config field; the full pull_ui_to_config()
+    # pass is kept for explicit sync points (start, preset save).
+    def on_field_changed(self, widget, key: str):
         if self._syncing_ui:
             return
-        self.pull_ui_to_config()
-        save_json(self.config_path, self.config)
+        typ = _EXPECTED_SCALAR_TYPES[key]
+        self.config[key] = typ(widget.get_active() if typ is bool else widget.get_value())
+        for lo_key, hi_key in _RANGE_PAIRS:
+            if key == lo_key or key == hi_key:
+                self._enforce_range(lo_key, hi_key)
+        self._schedule_save()
+
+    def on_key_field_changed(self, widget, key_name: str, field: str):
+        if self._syncing_ui:
+            return
+        entry = self.config["keys"][key_name]
+        if field == "enabled":
+            entry["enabled"] = bool(widget.get_active())
+        else:
+            entry["code"] = int(widget.get_value())
+        self._schedule_save()
+
+    def _enforce_range(self, lo_key: str, hi_key: str):
+        if self.config[hi_key] < self.config[lo_key]:
+            self.config[hi_key] = self.config[lo_key]
+            self._syncing_ui = True
+            try:
+                self._field_widgets[hi_key].set_value(self.config[hi_key])
+            finally:
+                self._syncing_ui = False
 
     # ---- capture ----
     def _set_capture_ui(self, capturing: bool, target_key: str | None):
@@ -898,15 +1334,18 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
             chk.set_active(True)
             spin.set_value(evdev)
             label.set_label(f"Key: {name}")
-            self.config["keys"][self.capture_target]["label"] = name
+            key_cfg = self.config["keys"][self.capture_target]
+            key_cfg["enabled"] = True
+            key_cfg["code"] = int(spin.get_value())
+            key_cfg["label"] = name
         finally:
             self._syncing_ui = False
 
         self.capture_target = None
         self._set_capture_ui(False, None)
 
-        self.pull_ui_to_config()
-        save_json(self.config_path, self.config)
+        # Rebinding several keys in a row lands in one debounced write.
+        self._schedule_save()
         self.set_status("Stopped")
         return True
 
@@ -919,19 +1358,13 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
                 spin.set_value(int(self.config["keys"][k]["code"]))
                 label.set_label(f"Key: {self.config['keys'][k].get('label', k)}")
 
-            self.diag_check.set_active(bool(self.config.get("enable_diagonals", True)))
-            self.min_delay.set_value(float(self.config.get("min_delay", 0.25)))
-            self.max_delay.set_value(float(self.config.get("max_delay", 0.90)))
-            self.press_min.set_value(float(self.config.get("press_min", 0.06)))
-            self.press_max.set_value(float(self.config.get("press_max", 0.20)))
-
-            self.idle_check.set_active(bool(self.config.get("idle_enabled", True)))
-            self.idle_chance.set_value(int(self.config.get("idle_chance", 10)))
-            self.idle_min.set_value(float(self.config.get("idle_min", 1.0)))
-            self.idle_max.set_value(float(self.config.get("idle_max", 3.5)))
-
-            self.double_check.set_active(bool(self.config.get("double_tap_enabled", True)))
-            self.double_chance.set_value(int(self.config.get("double_tap_chance", 8)))
+            for key, typ, default in _CONFIG_SCHEMA:
+                widget = self._field_widgets[key]
+                value = typ(self.config.get(key, default))
+                if typ is bool:
+                    widget.set_active(value)
+                else:
+                    widget.set_value(value)
         finally:
             self._syncing_ui = False
 
@@ -943,42 +1376,11 @@ class RUNKMaxWindow(Gtk.ApplicationWindow):
             if lbl:
                 self.config["keys"][k]["label"] = lbl
 
-        self.config["enable_diagonals"] = bool(self.diag_check.get_active())
-
-        self.config["min_delay"] = float(self.min_delay.get_value())
-        self.config["max_delay"] = float(self.max_delay.get_value())
-        if self.config["max_delay"] < self.config["min_delay"]:
-            self.config["max_delay"] = self.config["min_delay"]
-            self._syncing_ui = True
-            try:
-                self.max_delay.set_value(self.config["max_delay"])
-            finally:
-                self._syncing_ui = False
-
-        self.config["press_min"] = float(self.press_min.get_value())
-        self.config["press_max"] = float(self.press_max.get_value())
-        if self.config["press_max"] < self.config["press_min"]:
-            self.config["press_max"] = self.config["press_min"]
-            self._syncing_ui = True
-            try:
-                self.press_max.set_value(self.config["press_max"])
-            finally:
-                self._syncing_ui = False
-
-        self.config["idle_enabled"] = bool(self.idle_check.get_active())
-        self.config["idle_chance"] = int(self.idle_chance.get_value())
-        self.config["idle_min"] = float(self.idle_min.get_value())
-        self.config["idle_max"] = float(self.idle_max.get_value())
-        if self.config["idle_max"] < self.config["idle_min"]:
-            self.config["idle_max"] = self.config["idle_min"]
-            self._syncing_ui = True
-            try:
-                self.idle_max.set_value(self.config["idle_max"])
-            finally:
-                self._syncing_ui = False
-
-        self.config["double_tap_enabled"] = bool(self.double_check.get_active())
-        self.config["double_tap_chance"] = int(self.double_chance.get_value())
+        for key, widget in self._field_widgets.items():
+            typ = _EXPECTED_SCALAR_TYPES[key]
+            self.config[key] = typ(widget.get_active() if typ is bool else widget.get_value())
+        for lo_key, hi_key in _RANGE_PAIRS:
+            self._enforce_range(lo_key, hi_key)
 
 
 class RUNKMaxApp(Gtk.Application):